@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+CLI Task Tracker - Session Replay
+
+Replays recorded or generated sessions against a local stand-in sheet
+server and reports per-step latency percentiles.
+"""
+
+import sys
+from src.cli.replay_interface import ReplayCLI
+
+if __name__ == "__main__":
+    sys.exit(ReplayCLI().run())
@@ -1,6 +1,7 @@
 from rich.console import Console
 from typing import Optional
 from .menu_handler import MenuHandler
+from ..utils.io_utils import IOUtility
 
 console = Console()
 
@@ -13,7 +14,7 @@ class CLI:
     def run(self) -> None:
         """Main entry point for the CLI application."""
         try:
-            sheets_id = input("Share your GoogleSheets Activities file id: ")
+            sheets_id = IOUtility.ask("Share your GoogleSheets Activities file id: ")
             self.menu_handler = MenuHandler(sheets_id)
             self.menu_handler.run()
         except KeyboardInterrupt:
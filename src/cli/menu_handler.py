@@ -5,6 +5,7 @@ from ..core.progress_tracker import ProgressTracker
 from ..core.activity import Activity
 from ..utils.time_utils import TimeUtility
 from ..utils.question_utils import QuestionUtility
+from ..utils.io_utils import IOUtility
 from ..utils.spinner import Spinner
 from datetime import datetime, timedelta
 
@@ -12,6 +13,8 @@ console = Console()
 
 class MenuHandler:
     """Handles menu interactions and user input processing."""
+
+    CHOICE_PROMPT = "\nChoose an activity number (or 0 to exit): "
     
     def __init__(self, sheets_id: str):
         self.manager: Optional[ActivityManager] = None
@@ -64,7 +67,7 @@ class MenuHandler:
     def _get_user_choice(self) -> int:
         """Get user choice from input."""
         try:
-            choice = int(input("\nChoose an activity number (or 0 to exit): ")) - 1
+            choice = int(IOUtility.ask(self.CHOICE_PROMPT)) - 1
             return choice
         except (ValueError, IndexError):
             return -999  # Invalid choice
@@ -83,7 +86,7 @@ class MenuHandler:
         """Handle extending the workday."""
         """Extend the workday will give you a few more hours to work on your tasks."""
 
-        hours_to_extend = int(input("How many hours do you want to extend your workday? (Enter a number): "))
+        hours_to_extend = int(IOUtility.ask("How many hours do you want to extend your workday? (Enter a number): "))
         if hours_to_extend <= 0:
             print("❌ Invalid number of hours. Must be greater than 0.")
             Spinner().start()
@@ -135,7 +138,7 @@ class MenuHandler:
         if activity.is_repeated(self.tracker):
             print("You've done this activity already today.")
         else:
-            hours_worked = int(input("How many hours did you work? (Enter a number): "))
+            hours_worked = int(IOUtility.ask("How many hours did you work? (Enter a number): "))
             activity.time = hours_worked * 60
 
             if QuestionUtility.ask_yes_no("Did you finish it?"):
@@ -0,0 +1,99 @@
+import argparse
+from typing import List, Optional
+from rich.console import Console
+from rich.table import Table
+from ..replay.session_replay import (
+    DEFAULT_ACTIVITIES,
+    ReplayError,
+    SessionRecorder,
+    SessionReplay,
+    generate_session,
+    load_script,
+    percentile,
+    save_script,
+)
+from ..replay.sheet_server import SheetServer
+from ..utils.io_utils import IOUtility
+
+console = Console()
+
+class ReplayCLI:
+    """Replays scripted sessions and reports per-step latency percentiles."""
+
+    def __init__(self, argv: Optional[List[str]] = None):
+        self.args = self._parse_args(argv)
+
+    def _parse_args(self, argv: Optional[List[str]]) -> argparse.Namespace:
+        parser = argparse.ArgumentParser(description="Replay CLI sessions and time every step.")
+        parser.add_argument("script", nargs="?", help="Session script (JSON). A full session is generated when omitted.")
+        parser.add_argument("--record", metavar="PATH", help="Record a live session into PATH instead of replaying.")
+        parser.add_argument("--sheets-id", help="Activities sheet URL used while recording.")
+        parser.add_argument("--repeat", type=int, default=20, help="Number of replays (default: 20).")
+        parser.add_argument("--sheet-delay", type=float, default=0.0, metavar="MS", help="Simulated sheet latency in ms.")
+        parser.add_argument("--budget", type=float, metavar="MS", help="Fail when any step's p95 exceeds this many ms.")
+        parser.add_argument("--verbose", action="store_true", help="Show the application output while replaying.")
+        args = parser.parse_args(argv)
+        if args.repeat < 1:
+            parser.error("--repeat must be at least 1")
+        return args
+
+    def run(self) -> int:
+        """Main entry point for the replay tool. Returns the exit code."""
+        if self.args.record:
+            return self._record()
+        return self._replay()
+
+    def _record(self) -> int:
+        sheets_id = self.args.sheets_id or IOUtility.ask("Share your GoogleSheets Activities file id: ")
+        script = SessionRecorder(sheets_id).record()
+        save_script(self.args.record, script)
+        print(f"✅ Recorded {len(script['steps'])} steps to {self.args.record}")
+        return 0
+
+    def _replay(self) -> int:
+        script = load_script(self.args.script) if self.args.script else {}
+        activities = script.get("activities") or DEFAULT_ACTIVITIES
+        replay = SessionReplay(activities, script.get("progress"), script.get("recorded_on"))
+
+        with SheetServer(activities, delay=self.args.sheet_delay / 1000) as server:
+            for i in range(self.args.repeat):
+                steps = script["steps"] if self.args.script else generate_session(activities)
+                try:
+                    replay.run(steps, server.url, verbose=self.args.verbose)
+                except ReplayError as e:
+                    return self._report_failure(replay, i, str(e))
+                except Exception as e:
+                    return self._report_failure(replay, i, f"step '{replay.current_step}' crashed: {e!r}")
+
+        return self._report(replay)
+
+    def _report_failure(self, replay: SessionReplay, index: int, reason: str) -> int:
+        print(f"❌ Replay {index + 1} failed: {reason}")
+        print("\n".join(replay.transcript.splitlines()[-15:]))
+        return 2
+
+    def _report(self, replay: SessionReplay) -> int:
+        table = Table(title=f"Step latency over {self.args.repeat} replays (ms)")
+        for column in ("step", "n", "p50", "p95", "p99", "max"):
+            table.add_column(column, justify="left" if column == "step" else "right")
+
+        over_budget = []
+        for label, samples in replay.samples.items():
+            ms = [s * 1000 for s in samples]
+            p95 = percentile(ms, 95)
+            if self.args.budget is not None and p95 > self.args.budget:
+                over_budget.append(label)
+            table.add_row(
+                f"[#ff6b6b]{label}[/#ff6b6b]" if label in over_budget else label,
+                str(len(ms)),
+                f"{percentile(ms, 50):.1f}",
+                f"{p95:.1f}",
+                f"{percentile(ms, 99):.1f}",
+                f"{max(ms):.1f}",
+            )
+
+        console.print(table)
+        if over_budget:
+            print(f"❌ p95 over {self.args.budget:g} ms budget: {', '.join(over_budget)}")
+            return 1
+        return 0
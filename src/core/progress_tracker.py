@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Dict, Any
 import calendar
 from rich.console import Console
 from src.utils.time_utils import TimeUtility
+from src.utils.io_utils import IOUtility
 
 if TYPE_CHECKING:
     from src.core.activity import Activity
@@ -63,7 +64,7 @@ class ProgressTracker:
                 print("📭 No progress found so far.")
                 break
 
-            period = input("Delete progress by 'month', 'day' or 'entry'? Type a period or 'back' to exit: ").strip().lower()
+            period = IOUtility.ask("Delete progress by 'month', 'day' or 'entry'? Type a period or 'back' to exit: ").strip().lower()
 
             if period == "back":
                 print("🔙 Returning to previous menu.")
@@ -76,7 +77,7 @@ class ProgressTracker:
                 print(f"❌ '{period}' is not supported.")
 
     def handle_month_deletion(self):
-        target = input("Which month? (e.g., september): ").strip().lower()
+        target = IOUtility.ask("Which month? (e.g., september): ").strip().lower()
         try:
             month_number = list(calendar.month_name).index(target.capitalize())
             entries = self.filter_by_month(month_number)
@@ -86,7 +87,7 @@ class ProgressTracker:
 
     # Delete by day is not privding 
     def handle_day_deletion(self):
-        target = input("Which day? (e.g., 2025-09-05): ").strip()
+        target = IOUtility.ask("Which day? (e.g., 2025-09-05): ").strip()
         try:
             target_date = pd.to_datetime(target).date()
             entries = self.filter_by_day(target_date)
@@ -95,7 +96,7 @@ class ProgressTracker:
             print(f"❌ '{target}' is not a valid date.")
 
     def handle_single_entry_deletion(self):
-        target_day = input("Which day? (e.g., 2025-09-05): ").strip()
+        target_day = IOUtility.ask("Which day? (e.g., 2025-09-05): ").strip()
         
         try:
             target_date = pd.to_datetime(target_day).date()
@@ -104,7 +105,7 @@ class ProgressTracker:
                 print(f"{idx}. {row['tasks_finished']} ({row['date'].date()})")
             
             try:
-                target_index = int(input(f"Which entry do you want to delete from day {target_day}? (e.g., 5): "))
+                target_index = int(IOUtility.ask(f"Which entry do you want to delete from day {target_day}? (e.g., 5): "))
                 entry = self.filter_by_single_entry(target_date, target_index)
 
             except Exception:
@@ -134,7 +135,7 @@ class ProgressTracker:
                 date_text = "Unknown date"
             print(f"{idx}. {row['tasks_finished']} ({date_text})")
 
-        confirm = input("\nAre you sure you want to delete these entries? (yes/no): ").strip().lower()
+        confirm = IOUtility.ask("\nAre you sure you want to delete these entries? (yes/no): ").strip().lower()
         if confirm == "yes":
             self.update_progress(self.progress[~self.progress.index.isin(entries.index)])
             print(f"✅ Deleted progress for {label}.")
@@ -186,7 +187,7 @@ class ProgressTracker:
         console.print(f"\nTotal time dedicated: {hours_nu} of hours {minutes_nu_text} dedicated and {working_hours} working hours{minutes_work_text}.\n")
         
         while True:
-            go_back = input("Enter 'back' if you want to go back to main menu: ").strip().lower()
+            go_back = IOUtility.ask("Enter 'back' if you want to go back to main menu: ").strip().lower()
             if go_back == "back":
                 return
 
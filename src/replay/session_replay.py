@@ -0,0 +1,296 @@
+import calendar
+import contextlib
+import io
+import json
+import math
+import os
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, NoReturn, Optional
+import pandas as pd
+from ..cli.menu_handler import MenuHandler
+from ..config.settings import PROGRESS_FILE
+from ..utils.io_utils import IOUtility
+from ..utils.spinner import Spinner
+from ..utils.time_utils import TimeUtility
+
+# Menu entries listed after the activities, as numbered by MenuHandler.
+MENU_OFFSETS = {
+    "update_progress": 1,
+    "show_progress": 2,
+    "extend_day": 3,
+    "refresh": 4,
+    "time_warp": 5,
+}
+
+DEFAULT_ACTIVITIES = [
+    {"activity": "work", "activityTime": 60, "reward": "", "urgent": "yes",
+     "quotaPerWeek": 5, "triggerQuestion": "Did you work today?"},
+    {"activity": "reading", "activityTime": 30, "reward": "coffee", "urgent": "no",
+     "quotaPerWeek": 3, "triggerQuestion": "Did you read for 30 minutes?"},
+    {"activity": "gym", "activityTime": 45, "reward": "smoothie", "urgent": "no",
+     "quotaPerWeek": 2, "triggerQuestion": "Did you go to the gym?"},
+]
+
+
+class ReplayError(RuntimeError):
+    """Raised when a script falls out of step with the prompts it answers."""
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of samples."""
+    ordered = sorted(samples)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def generate_session(activities: List[Dict[str, Any]], now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """Build a session touching every menu path, including the virtual-time ones."""
+    now = now or datetime.now()
+    urgent = next(act for act in activities if str(act["urgent"]).lower() == "yes")
+    optional = next(act for act in activities if str(act["urgent"]).lower() != "yes")
+
+    # Extending by a full day always moves the virtual clock to yesterday, which
+    # unlocks the urgent task again and shows the "Back to the present!" entry.
+    extend_hours = 24
+    yesterday = now - timedelta(days=1)
+
+    # Deleting this month empties the progress unless yesterday was last month,
+    # in which case the deletion prompt comes back and needs a 'back'.
+    delete_answers = ["month", calendar.month_name[now.month].lower(), "yes"]
+    if yesterday.month != now.month:
+        delete_answers.append("back")
+
+    return [
+        {"label": "log_hours", "action": "select", "activity": urgent["activity"], "answers": ["8", "y"]},
+        {"label": "log_optional", "action": "select", "activity": optional["activity"], "answers": ["y"]},
+        {"action": "show_progress", "answers": ["back"]},
+        {"action": "extend_day", "answers": [str(extend_hours)]},
+        {"label": "log_hours_virtual", "action": "select", "activity": urgent["activity"], "answers": ["4", "y"]},
+        {"label": "show_progress_virtual", "action": "show_progress", "answers": ["back"]},
+        {"action": "time_warp"},
+        {"action": "refresh"},
+        {"label": "delete_month", "action": "update_progress", "answers": delete_answers},
+        {"action": "exit"},
+    ]
+
+
+def step_for_choice(answer: str, activity_names: List[str]) -> Dict[str, Any]:
+    """Map a typed main-menu answer back to a script step."""
+    try:
+        number = int(answer)
+    except ValueError:
+        return {"action": "invalid"}
+
+    if number == 0:
+        return {"action": "exit"}
+    if 1 <= number <= len(activity_names):
+        return {"action": "select", "activity": activity_names[number - 1]}
+    for action, offset in MENU_OFFSETS.items():
+        if number == len(activity_names) + offset:
+            return {"action": action}
+    return {"action": "invalid"}
+
+
+def shift_progress(rows: List[Dict[str, Any]], recorded_on: str, today: Optional[date] = None) -> List[Dict[str, Any]]:
+    """Move progress rows forward by the days elapsed since recorded_on.
+
+    Keeps entries logged "today" at recording time on today's date, so
+    activities that were already completed still count as completed.
+    """
+    if not rows:
+        return []
+    offset = (today or date.today()) - date.fromisoformat(recorded_on)
+    shifted = pd.DataFrame(rows)
+    shifted["date"] = (pd.to_datetime(shifted["date"], errors="coerce") + offset).dt.strftime("%Y-%m-%d")
+    return json.loads(shifted.to_json(orient="records"))
+
+
+def load_script(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_script(path: str, script: Dict[str, Any]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(script, f, indent=2)
+
+
+@contextlib.contextmanager
+def _sandbox(progress: List[Dict[str, Any]]):
+    """Run inside a throwaway directory so the real progress file is untouched."""
+    previous_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.makedirs(os.path.join(workdir, os.path.dirname(PROGRESS_FILE)), exist_ok=True)
+        os.chdir(workdir)
+        if progress:
+            pd.DataFrame(progress).to_csv(PROGRESS_FILE, index=False)
+        try:
+            yield
+        finally:
+            os.chdir(previous_cwd)
+
+
+class SessionReplay:
+    """Drives MenuHandler through scripted steps and times each one.
+
+    A step's latency runs from the moment its menu choice is entered until the
+    main menu prompts again, so it covers the handler, any follow-up prompts
+    (answered instantly from the script) and the menu redraw.
+    """
+
+    def __init__(self, activities: List[Dict[str, Any]], progress: Optional[List[Dict[str, Any]]] = None,
+                 recorded_on: Optional[str] = None):
+        self.activity_names = [act["activity"] for act in activities]
+        self.progress = progress or []
+        self.recorded_on = recorded_on
+        self.samples: Dict[str, List[float]] = {}
+        self.transcript = ""
+
+    def run(self, steps: List[Dict[str, Any]], sheets_url: str, verbose: bool = False) -> None:
+        """Replay steps once against sheets_url, adding to self.samples."""
+        self._steps = steps
+        self._cursor = 0
+        self._label = "startup"
+        self._pending: List[str] = []
+        self._failure: Optional[ReplayError] = None
+        self._failed_at: Optional[int] = None
+
+        self._output = output = io.StringIO()
+        IOUtility.set_input(self._answer)
+        previous_duration = Spinner.set_duration(0)
+        TimeUtility.reset_virtual_now()
+        try:
+            progress = shift_progress(self.progress, self.recorded_on) if self.recorded_on else self.progress
+            with _sandbox(progress), contextlib.ExitStack() as stack:
+                if not verbose:
+                    stack.enter_context(contextlib.redirect_stdout(output))
+                self._started = time.perf_counter()
+                MenuHandler(sheets_url).run()
+                self._record()
+                if self._cursor < len(self._steps):
+                    self._failure = ReplayError(f"app exited with {len(self._steps) - self._cursor} steps left")
+                elif self._pending:
+                    self._failure = ReplayError(f"step '{self._label}' left unused answers {self._pending}")
+        except Exception as e:
+            # A handler's own except block can fail while handling our
+            # ReplayError; report the desync rather than that secondary crash.
+            if self._failure is not None and e is not self._failure:
+                raise self._failure from e
+            raise
+        finally:
+            IOUtility.reset_input()
+            Spinner.set_duration(previous_duration)
+            TimeUtility.reset_virtual_now()
+            # Cut at the first failure; handlers may keep printing after it.
+            self.transcript = output.getvalue()[:self._failed_at]
+
+        # Handlers that swallow exceptions may have hidden a desync, and a
+        # script can also stop short of or run past the end of the session.
+        if self._failure:
+            raise self._failure
+
+    @property
+    def current_step(self) -> str:
+        """Label of the step being replayed, or the last one that ran."""
+        return self._label
+
+    def _answer(self, prompt: str) -> str:
+        if self._failure:
+            raise self._failure
+        if prompt == MenuHandler.CHOICE_PROMPT:
+            answer = self._next_step()
+        elif not self._pending:
+            print(prompt)
+            self._fail(f"step '{self._label}' has no answer for prompt {prompt.strip()!r}")
+        else:
+            answer = self._pending.pop(0)
+        # Echo the exchange the way a terminal would, so the transcript shows it.
+        print(f"{prompt}{answer}")
+        return answer
+
+    def _next_step(self) -> str:
+        self._record()
+        if self._pending:
+            self._fail(f"step '{self._label}' left unused answers {self._pending}")
+
+        if self._cursor < len(self._steps):
+            step = self._steps[self._cursor]
+            self._cursor += 1
+        else:
+            step = {"action": "exit"}
+
+        self._label = step.get("label", step["action"])
+        self._pending = [str(answer) for answer in step.get("answers", [])]
+        choice = self._menu_choice(step)
+        self._started = time.perf_counter()
+        return choice
+
+    def _menu_choice(self, step: Dict[str, Any]) -> str:
+        action = step["action"]
+        if action == "exit":
+            return "0"
+        if action == "invalid":
+            return ""
+        if action == "select":
+            if step.get("activity") not in self.activity_names:
+                self._fail(f"unknown activity {step.get('activity')!r}")
+            return str(self.activity_names.index(step["activity"]) + 1)
+        if action in MENU_OFFSETS:
+            return str(len(self.activity_names) + MENU_OFFSETS[action])
+        self._fail(f"unknown action {action!r}")
+
+    def _record(self) -> None:
+        elapsed = time.perf_counter() - self._started
+        self.samples.setdefault(self._label, []).append(elapsed)
+
+    def _fail(self, message: str) -> NoReturn:
+        self._failure = ReplayError(message)
+        self._failed_at = len(self._output.getvalue())
+        raise self._failure
+
+
+class SessionRecorder:
+    """Records a live interactive session as a replayable script."""
+
+    def __init__(self, sheets_id: str):
+        self.handler = MenuHandler(sheets_id)
+        self.steps: List[Dict[str, Any]] = []
+        # Replays start from the same progress the recording started from.
+        self.progress = json.loads(pd.read_csv(PROGRESS_FILE).to_json(orient="records"))
+        self.recorded_on = date.today().isoformat()
+        self._in_follow_up = False
+
+    def record(self) -> Dict[str, Any]:
+        """Run the normal menu loop, capturing every answer along the way."""
+        IOUtility.set_input(self._answer)
+        try:
+            self.handler.run()
+        except KeyboardInterrupt:
+            # Stopped at a follow-up prompt: the last step is missing answers
+            # and would never replay, so leave it out.
+            if self.steps and self._in_follow_up:
+                self.steps.pop()
+            print("\n👋 Recording stopped.")
+        finally:
+            IOUtility.reset_input()
+
+        activities = self.handler.manager.activities if self.handler.manager else None
+        return {
+            "activities": json.loads(activities.to_json(orient="records")) if activities is not None else [],
+            "progress": self.progress,
+            "recorded_on": self.recorded_on,
+            "steps": self.steps,
+        }
+
+    def _answer(self, prompt: str) -> str:
+        self._in_follow_up = prompt != MenuHandler.CHOICE_PROMPT
+        answer = input(prompt)
+        self._in_follow_up = False
+        if prompt == MenuHandler.CHOICE_PROMPT:
+            names = self.handler.manager.activities["activity"].tolist() if not self.handler.manager.activities.empty else []
+            self.steps.append(step_for_choice(answer, names))
+        elif self.steps:
+            self.steps[-1].setdefault("answers", []).append(answer)
+        return answer
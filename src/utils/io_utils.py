@@ -0,0 +1,16 @@
+class IOUtility:
+    _input_fn = None  # Class-level override
+
+    @classmethod
+    def set_input(cls, fn) -> None:
+        """Route every prompt through fn instead of the builtin input."""
+        cls._input_fn = fn
+
+    @classmethod
+    def reset_input(cls) -> None:
+        cls._input_fn = None
+
+    @classmethod
+    def ask(cls, prompt: str = "") -> str:
+        """Prompt the user and return the raw answer."""
+        return (cls._input_fn or input)(prompt)
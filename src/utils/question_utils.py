@@ -1,6 +1,8 @@
+from .io_utils import IOUtility
+
 class QuestionUtility:
     @staticmethod
     def ask_yes_no(question: str) -> bool:
         """Ask a yes/no question and return boolean result."""
-        answer = input(f"{question} (y/n): ").lower().strip()
+        answer = IOUtility.ask(f"{question} (y/n): ").lower().strip()
         return answer in ["y", "yes"]
@@ -2,12 +2,20 @@ from rich.console import Console
 import time
 
 class Spinner:
+    _duration = 2  # Class-level override, in seconds
+
     def __init__(self):
         self.console = Console()
         self.spinner = "bouncingBall"
         self.spinner_style = "white"
 
+    @classmethod
+    def set_duration(cls, seconds: float) -> float:
+        """Set how long the spinner runs and return the previous duration."""
+        previous, cls._duration = cls._duration, seconds
+        return previous
+
     def start(self) -> None:
         """Start the spinner animation."""
         with self.console.status(f"\n[{self.spinner_style}]", spinner=self.spinner, spinner_style=self.spinner_style):
-            time.sleep(2)
+            time.sleep(self._duration)
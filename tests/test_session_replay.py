@@ -0,0 +1,155 @@
+import builtins
+import calendar
+from datetime import date, datetime
+import pandas as pd
+import pytest
+from src.cli.replay_interface import ReplayCLI
+from src.config.settings import PROGRESS_FILE
+from src.replay.session_replay import (
+    DEFAULT_ACTIVITIES,
+    ReplayError,
+    SessionRecorder,
+    SessionReplay,
+    generate_session,
+    percentile,
+    shift_progress,
+    step_for_choice,
+)
+from src.utils.spinner import Spinner
+from src.replay.sheet_server import SheetServer
+
+NAMES = [act["activity"] for act in DEFAULT_ACTIVITIES]
+
+
+@pytest.fixture(scope="module")
+def sheets_url():
+    with SheetServer(DEFAULT_ACTIVITIES) as server:
+        yield server.url
+
+
+def test_percentile_is_nearest_rank():
+    samples = [float(n) for n in range(10, 0, -1)]
+    assert percentile(samples, 50) == 5
+    assert percentile(samples, 95) == 10
+    assert percentile(samples, 11) == 2
+    assert percentile(samples, 0) == 1
+    assert percentile([7.0], 99) == 7
+
+
+@pytest.mark.parametrize("answer, step", [
+    ("0", {"action": "exit"}),
+    ("2", {"action": "select", "activity": "reading"}),
+    ("4", {"action": "update_progress"}),
+    ("5", {"action": "show_progress"}),
+    ("6", {"action": "extend_day"}),
+    ("7", {"action": "refresh"}),
+    ("8", {"action": "time_warp"}),
+    ("9", {"action": "invalid"}),
+    ("abc", {"action": "invalid"}),
+])
+def test_step_for_choice(answer, step):
+    assert step_for_choice(answer, NAMES) == step
+
+
+def _delete_answers(now):
+    steps = generate_session(DEFAULT_ACTIVITIES, now=now)
+    return next(step["answers"] for step in steps if step.get("label") == "delete_month")
+
+
+def test_generate_session_mid_month_empties_progress():
+    assert _delete_answers(datetime(2025, 10, 15, 9)) == ["month", "october", "yes"]
+
+
+def test_generate_session_first_of_month_goes_back():
+    assert _delete_answers(datetime(2025, 10, 1, 9)) == ["month", "october", "yes", "back"]
+
+
+def test_generated_session_replays(sheets_url):
+    replay = SessionReplay(DEFAULT_ACTIVITIES)
+    replay.run(generate_session(DEFAULT_ACTIVITIES), sheets_url)
+    assert "time_warp" in replay.samples
+    assert len(replay.samples["log_hours_virtual"]) == 1
+
+
+@pytest.mark.parametrize("steps, message", [
+    ([{"action": "show_progress", "answers": ["back", "extra"]}], "left unused answers"),
+    ([{"action": "select", "activity": "work", "answers": ["8"]}], "has no answer for prompt"),
+    ([{"action": "exit"}, {"action": "show_progress", "answers": ["back"]}], "steps left"),
+    ([{"action": "exit", "answers": ["back"]}], "left unused answers"),
+    ([{"action": "select", "activity": "work", "answers": ["8", "y"]},
+      {"action": "update_progress", "answers": ["entry", date.today().isoformat()]}], "has no answer for prompt 'Which entry"),
+])
+def test_desync_fails_replay(sheets_url, steps, message):
+    replay = SessionReplay(DEFAULT_ACTIVITIES)
+    with pytest.raises(ReplayError, match=message):
+        replay.run(steps, sheets_url)
+
+
+def test_shift_progress_keeps_entries_relative_to_today():
+    rows = [{"date": "2025-09-30", "tasks_finished": "work"}, {"date": "2025-10-01", "tasks_finished": "gym"}]
+    shifted = shift_progress(rows, "2025-10-01", today=date(2025, 10, 19))
+    assert [row["date"] for row in shifted] == ["2025-10-18", "2025-10-19"]
+    assert shifted[0]["tasks_finished"] == "work"
+
+
+def test_recorded_session_with_existing_progress_replays(sheets_url, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    today = date.today().isoformat()
+    pd.DataFrame([{"date": today, "tasks_finished": "work", "time_dedicated": 480, "rewards": None}]).to_csv(
+        PROGRESS_FILE, index=False)
+
+    # Work is already logged, so selecting it asks nothing; the month deletion is cancelled.
+    answers = iter(["1", "4", "month", calendar.month_name[date.today().month].lower(), "no", "back", "0"])
+    monkeypatch.setattr(builtins, "input", lambda prompt="": next(answers))
+    monkeypatch.setattr(Spinner, "_duration", 0)
+    script = SessionRecorder(sheets_url).record()
+
+    assert script["progress"][0]["tasks_finished"] == "work"
+    assert script["steps"][0] == {"action": "select", "activity": "work"}
+
+    replay = SessionReplay(script["activities"], script["progress"], script["recorded_on"])
+    replay.run(script["steps"], sheets_url)
+    assert len(replay.samples["update_progress"]) == 1
+
+
+@pytest.mark.parametrize("answers, steps", [
+    # Ctrl-C at a follow-up prompt drops the unfinished step.
+    (["2", KeyboardInterrupt], []),
+    # Ctrl-C at the main menu keeps every finished step.
+    (["7", KeyboardInterrupt], [{"action": "refresh"}]),
+])
+def test_recording_interrupted_by_ctrl_c(sheets_url, tmp_path, monkeypatch, answers, steps):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    pending = iter(answers)
+
+    def fake_input(prompt=""):
+        answer = next(pending)
+        if answer is KeyboardInterrupt:
+            raise KeyboardInterrupt
+        return answer
+
+    monkeypatch.setattr(builtins, "input", fake_input)
+    monkeypatch.setattr(Spinner, "_duration", 0)
+    assert SessionRecorder(sheets_url).record()["steps"] == steps
+
+
+def test_recording_keeps_step_interrupted_by_ctrl_c_after_its_prompts(sheets_url, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    monkeypatch.setattr(builtins, "input", lambda prompt="": "7")
+    monkeypatch.setattr(Spinner, "_duration", 0)
+
+    def interrupted_spinner(self):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(Spinner, "start", interrupted_spinner)
+    assert SessionRecorder(sheets_url).record()["steps"] == [{"action": "refresh"}]
+
+
+@pytest.mark.parametrize("repeat", ["0", "-1"])
+def test_repeat_must_be_positive(repeat):
+    with pytest.raises(SystemExit) as exc:
+        ReplayCLI(["--repeat", repeat])
+    assert exc.value.code == 2